@@ -5,17 +5,37 @@ Adapted from LAURA project for portable voice-first interaction
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import re
 import os
 import sys
 import time
+import io
 import hashlib
 import subprocess
 import tempfile
+import shutil
+import atexit
+import functools
+import random
+from collections import OrderedDict
 from typing import Optional, Tuple, Dict
 from pathlib import Path
 
+try:
+    from orjson import loads as _json_loads, dumps as _json_dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows: cache file writes are unlocked
+
 # Load .env file from plugin root directory if it exists
 try:
     from dotenv import load_dotenv
@@ -50,21 +70,18 @@ VOICE_MAPPINGS = {
     "american": "qEwI395unGwWV1dn3Y65",
 }
 
-def get_voice_id(voice_input: str) -> str:
-    """
-    Get voice ID from input - supports names, IDs, or defaults
-    Returns a valid voice ID or falls back to default
-    """
-    if not voice_input:
-        # Try environment variable first
-        env_voice = os.environ.get('CLAUDE_VOICE_ID', '')
-        if env_voice:
-            return get_voice_id(env_voice)  # Recursive to handle names
-        return VOICE_MAPPINGS["default"]
+# Built once: voice ID -> names for --list-voices
+_VOICES_BY_ID: Dict[str, list] = {}
+for _name, _voice_id in sorted(VOICE_MAPPINGS.items()):
+    _VOICES_BY_ID.setdefault(_voice_id, []).append(_name)
 
-    # Clean input
-    voice_input = voice_input.lower().strip()
+# Read once; get_voice_id(None) falls back to it without touching os.environ again
+_DEFAULT_VOICE_INPUT = os.environ.get('CLAUDE_VOICE_ID', '')
 
+
+@functools.lru_cache(maxsize=128)
+def _resolve_voice_id(voice_input: str) -> str:
+    """Resolve a normalized (lowercased, stripped) voice name or ID; memoized"""
     # Check if it's a known mapping
     if voice_input in VOICE_MAPPINGS:
         return VOICE_MAPPINGS[voice_input]
@@ -82,6 +99,20 @@ def get_voice_id(voice_input: str) -> str:
     print(f"⚠️  Unknown voice '{voice_input}', using default")
     return VOICE_MAPPINGS["default"]
 
+
+def get_voice_id(voice_input: str) -> str:
+    """
+    Get voice ID from input - supports names, IDs, or defaults
+    Returns a valid voice ID or falls back to default
+    """
+    if not voice_input:
+        # Try environment variable first
+        if _DEFAULT_VOICE_INPUT:
+            return get_voice_id(_DEFAULT_VOICE_INPUT)  # Recursive to handle names
+        return VOICE_MAPPINGS["default"]
+
+    return _resolve_voice_id(voice_input.lower().strip())
+
 # Configuration - can be overridden by config.py or environment variables
 try:
     from config import ELEVENLABS_API_KEY, VOICE_ID, SERVER_URL, ELEVENLABS_MODEL
@@ -93,75 +124,383 @@ except ImportError:
     SERVER_URL = os.environ.get('TTS_SERVER_URL', '')  # Empty = direct API mode
     ELEVENLABS_MODEL = os.environ.get('ELEVENLABS_MODEL', 'eleven_flash_v2_5')  # Fast model
 
+# Direct API streaming: latency level 3 is the most aggressive setting that keeps
+# ElevenLabs' text normalizer (numbers, dates), and 22 kHz/32 kbps MP3 is ample for speech.
+# pcm_<rate> (e.g. pcm_16000) skips MP3 decoding entirely; it needs aplay, sox or ffplay.
+# winsound cannot decode MP3 at all, so Windows defaults to PCM played from memory.
+ELEVENLABS_OUTPUT_FORMAT = os.environ.get(
+    'ELEVENLABS_OUTPUT_FORMAT', 'pcm_22050' if sys.platform == "win32" else 'mp3_22050_32')
+STREAM_PARAMS = {
+    "optimize_streaming_latency": 3,
+    "output_format": ELEVENLABS_OUTPUT_FORMAT,
+}
+# Sample rate of raw 16-bit mono output, or None for MP3
+PCM_RATE = (ELEVENLABS_OUTPUT_FORMAT.split('_')[1]
+            if ELEVENLABS_OUTPUT_FORMAT.startswith('pcm_') else None)
+
+# One pooled keep-alive session for every request, so repeated utterances from a
+# long-lived importer skip the TCP + TLS handshake
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+
+# Built once; kept off the session so the API key is never sent to SERVER_URL
+ELEVENLABS_HEADERS = {
+    "xi-api-key": ELEVENLABS_API_KEY,
+    "Accept": "*/*" if PCM_RATE else "audio/mpeg",
+}
+
+# Players that decode MP3 from stdin, tried in order
+_FFPLAY_STDIN = ["ffplay", "-autoexit", "-nodisp", "-loglevel", "quiet", "-i", "-"]
+STREAMING_PLAYERS = {
+    "darwin": [_FFPLAY_STDIN],  # afplay cannot read stdin; falls back to a temp file
+    "linux": [["mpg123", "-q", "-"], ["mpg321", "-q", "-"], _FFPLAY_STDIN,
+              ["play", "-q", "-t", "mp3", "-"]],
+}
+
+# Players for raw signed 16-bit little-endian mono PCM from stdin, tried in order
+if PCM_RATE:
+    _FFPLAY_PCM = ["ffplay", "-autoexit", "-nodisp", "-loglevel", "quiet",
+                   "-f", "s16le", "-ar", PCM_RATE, "-ac", "1", "-i", "-"]
+    STREAMING_PLAYERS = {
+        "darwin": [_FFPLAY_PCM],
+        "linux": [["aplay", "-q", "-t", "raw", "-f", "S16_LE", "-r", PCM_RATE, "-c", "1", "-"],
+                  ["play", "-q", "-t", "raw", "-e", "signed", "-b", "16", "-r", PCM_RATE, "-c", "1", "-"],
+                  _FFPLAY_PCM],
+    }
+
+
+def _find_player(candidates) -> Optional[list]:
+    """Return the first candidate command whose binary is on PATH, with its resolved path"""
+    for cmd in candidates:
+        path = shutil.which(cmd[0])
+        if path:
+            return [path] + cmd[1:]
+    return None
+
+
+# Players produce nothing worth reading, so output goes to /dev/null rather than
+# pipes; their own session keeps a Ctrl-C in the calling terminal from cutting audio off
+_PLAYER_KWARGS = {
+    "stdout": subprocess.DEVNULL,
+    "stderr": subprocess.DEVNULL,
+    "start_new_session": sys.platform != "win32",
+}
+
+# Resolved once at import instead of probing for missing binaries on every utterance
+STREAMING_PLAYER = (None if sys.platform == "win32"
+                    else _find_player(STREAMING_PLAYERS.get(sys.platform, STREAMING_PLAYERS["linux"])))
+
+# Content-addressed cache of synthesized clips for direct API mode, pruned LRU by mtime
+AUDIO_CACHE_DIR = Path(os.environ.get(
+    'CLAUDE_TTS_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'claude_tts_audio_cache')))
+AUDIO_CACHE_MAX_BYTES = int(os.environ.get('CLAUDE_TTS_CACHE_MAX_MB', '200')) * 1024 * 1024
+# In-progress downloads; skipped by pruning until renamed to their final name
+_CACHE_TMP_PREFIX = '.part-'
+
 # TTS Settings
 DEFAULT_TIMEOUT = 10.0
 RETRY_ATTEMPTS = 2
 RETRY_DELAY = 0.5
+RETRY_MAX_DELAY = 2.0  # cap for the jittered backoff between attempts
 
 # Deduplication tracking
-recent_messages: Dict[str, float] = {}
 MESSAGE_DEDUP_WINDOW = 2.0  # seconds
 DEDUP_CACHE_FILE = "/tmp/claude_tts_dedup_cache.json"
+DEDUP_MAX_ENTRIES = 256
+DEDUP_FLUSH_INTERVAL = 1.0  # seconds between cache file rewrites
+
+# In-process view of the dedup cache, oldest first; merged from DEDUP_CACHE_FILE
+# whenever its mtime shows another process has written it
+_DEDUP: "OrderedDict[str, float]" = OrderedDict()
+_DEDUP_MTIME_NS: Optional[int] = None
+_DEDUP_DIRTY = False
+_DEDUP_LAST_FLUSH = 0.0
 
 
 def load_dedup_cache() -> Dict[str, float]:
     """Load deduplication cache from file"""
     try:
-        if os.path.exists(DEDUP_CACHE_FILE):
-            with open(DEDUP_CACHE_FILE, 'r') as f:
-                cache = json.load(f)
-                # Clean old entries
-                current_time = time.time()
-                return {k: v for k, v in cache.items()
-                       if current_time - v < MESSAGE_DEDUP_WINDOW * 2}
+        # Just open it: a missing file (the common first-run case) falls through to {}
+        # like any other failure, and an exists() check first would only add a stat
+        with open(DEDUP_CACHE_FILE, 'rb') as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_SH)
+            cache = _json_loads(f.read())
+            # Clean old entries
+            current_time = time.time()
+            return {k: v for k, v in cache.items()
+                   if current_time - v < MESSAGE_DEDUP_WINDOW * 2}
     except Exception:
         pass
     return {}
 
 
-def save_dedup_cache(cache: Dict[str, float]) -> None:
-    """Save deduplication cache to file"""
+def save_dedup_cache(cache: Dict[str, float]) -> Optional[int]:
+    """Save deduplication cache to file, returning the file's new mtime in ns"""
     try:
-        with open(DEDUP_CACHE_FILE, 'w') as f:
-            json.dump(cache, f)
+        # Truncate only after taking the lock so concurrent readers never see a half-written file
+        data = _json_dumps(cache)
+        fd = os.open(DEDUP_CACHE_FILE, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            os.ftruncate(fd, 0)
+            os.write(fd, data)
+            return os.fstat(fd).st_mtime_ns
+        finally:
+            os.close(fd)
     except Exception:
-        pass
+        return None
+
+
+def _flush_dedup_cache(force: bool = False) -> None:
+    """Persist the dedup cache if it changed, at most once per DEDUP_FLUSH_INTERVAL unless forced"""
+    global _DEDUP_DIRTY, _DEDUP_LAST_FLUSH, _DEDUP_MTIME_NS
+    now = time.time()
+    if not _DEDUP_DIRTY or (not force and now - _DEDUP_LAST_FLUSH < DEDUP_FLUSH_INTERVAL):
+        return
+    # Our own write must not look like another process's on the next check
+    _DEDUP_MTIME_NS = save_dedup_cache(dict(_DEDUP))
+    _DEDUP_DIRTY = False
+    _DEDUP_LAST_FLUSH = now
+
+
+atexit.register(_flush_dedup_cache, force=True)
+
+
+def _dedup_record(text_hash: str, now: float) -> None:
+    """Mark text_hash as spoken at `now`, keeping the cache ordered oldest-first and bounded"""
+    global _DEDUP_DIRTY
+    _DEDUP[text_hash] = now
+    _DEDUP.move_to_end(text_hash)
+    while len(_DEDUP) > DEDUP_MAX_ENTRIES:
+        _DEDUP.popitem(last=False)
+    _DEDUP_DIRTY = True
+    _flush_dedup_cache()
+
+
+def _dedup_check(text_hash: str, now: float) -> Optional[float]:
+    """
+    Return when text_hash was last spoken if that was within MESSAGE_DEDUP_WINDOW,
+    otherwise record it as spoken now and return None
+    """
+    global _DEDUP_MTIME_NS
+    # A stat is enough to tell whether the file needs parsing again
+    try:
+        mtime_ns = os.stat(DEDUP_CACHE_FILE).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if mtime_ns is not None and mtime_ns != _DEDUP_MTIME_NS:
+        merged = dict(_DEDUP)
+        for key, ts in load_dedup_cache().items():
+            if ts > merged.get(key, 0.0):
+                merged[key] = ts
+        _DEDUP.clear()
+        _DEDUP.update(sorted(merged.items(), key=lambda item: item[1]))
+        _DEDUP_MTIME_NS = mtime_ns
+
+    # Entries are in time order, so only the expired prefix is visited
+    while _DEDUP and now - next(iter(_DEDUP.values())) >= MESSAGE_DEDUP_WINDOW:
+        _DEDUP.popitem(last=False)
+
+    last_spoken = _DEDUP.get(text_hash)
+    if last_spoken is not None:
+        return last_spoken
+
+    _dedup_record(text_hash, now)
+    return None
+
+
+# Speech cleanup tables, compiled once at import
+_SPEECH_REPLACEMENTS = {
+    "You're absolutely right": "You're right",
+    "I've": "I have",
+    "you've": "you have",
+    "we've": "we have",
+    "they've": "they have",
+}
+# One alternation so the text is scanned once; case-sensitive to match the table exactly
+_RE_SPEECH_REPLACEMENTS = re.compile("|".join(map(re.escape, _SPEECH_REPLACEMENTS)))
+_RE_DOT = re.compile(r'(\w)\.(\w)')
+_RE_SYMBOLS = re.compile(r'[\\|}{[\]/%*#@$^&+=<>~`"()]')
+_RE_HYPHEN_MID = re.compile(r'\s+-\s+')
+_RE_HYPHEN_LEAD = re.compile(r'^-\s+')
+_RE_HYPHEN_TAIL = re.compile(r'\s+-$')
+_RE_WS = re.compile(r'\s+')
 
 
 def clean_text_for_speech(text: str) -> str:
     """Clean text for better TTS pronunciation"""
     # Replace common phrases that sound robotic
-    text = text.replace("You're absolutely right", "You're right")
-    text = text.replace("I've", "I have")
-    text = text.replace("you've", "you have")
-    text = text.replace("we've", "we have")
-    text = text.replace("they've", "they have")
+    text = _RE_SPEECH_REPLACEMENTS.sub(lambda m: _SPEECH_REPLACEMENTS[m.group(0)], text)
 
     # Replace underscores with spaces
     text = text.replace('_', ' ')
 
     # Handle dots between text (e.g., "file.txt" -> "file dot txt")
-    text = re.sub(r'(\w)\.(\w)', r'\1 dot \2', text)
+    text = _RE_DOT.sub(r'\1 dot \2', text)
 
     # Remove problematic symbols while keeping natural punctuation
-    symbols_to_remove = r'[\\|}{[\]/%*#@$^&+=<>~`"()]'
-    text = re.sub(symbols_to_remove, ' ', text)
+    text = _RE_SYMBOLS.sub(' ', text)
 
     # Handle hyphens intelligently
-    text = re.sub(r'\s+-\s+', ' ', text)
-    text = re.sub(r'^-\s+', '', text)
-    text = re.sub(r'\s+-$', '', text)
+    text = _RE_HYPHEN_MID.sub(' ', text)
+    text = _RE_HYPHEN_LEAD.sub('', text)
+    text = _RE_HYPHEN_TAIL.sub('', text)
 
     # Clean up multiple spaces
-    text = re.sub(r'\s+', ' ', text)
+    text = _RE_WS.sub(' ', text)
 
     return text.strip()
 
 
-def send_tts_request(text: str, voice_id: str = None, timeout: float = DEFAULT_TIMEOUT) -> Tuple[bool, str]:
+def _audio_cache_path(text_bytes: bytes, voice_id: str) -> Path:
+    """Cache file for a clip; keyed on everything that changes the synthesized audio"""
+    key = hashlib.blake2b(f"{voice_id}|{ELEVENLABS_MODEL}|{STREAM_PARAMS['output_format']}|".encode('utf-8'),
+                          digest_size=16)
+    key.update(text_bytes)
+    ext = ".pcm" if PCM_RATE else ".mp3"
+    return AUDIO_CACHE_DIR / (key.hexdigest() + ext)
+
+
+def _open_cache_tmp(cache_path: Path):
+    """
+    Temp file next to the cache so a finished clip can be renamed into place
+    Keeps the clip's extension, since players like afplay pick the decoder from it
+    """
+    try:
+        AUDIO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        return tempfile.NamedTemporaryFile(dir=AUDIO_CACHE_DIR, prefix=_CACHE_TMP_PREFIX,
+                                           suffix=cache_path.suffix, delete=False)
+    except OSError:
+        return None
+
+
+def _commit_cache_tmp(tmp, cache_path: Path, complete: bool) -> None:
+    """Publish a fully downloaded clip into the cache, or discard a partial one"""
+    tmp.close()
+    try:
+        if complete and os.path.getsize(tmp.name) > 0:
+            os.replace(tmp.name, cache_path)
+            _prune_audio_cache()
+        else:
+            os.unlink(tmp.name)
+    except OSError:
+        pass
+
+
+def _prune_audio_cache() -> None:
+    """Evict least recently played clips once the cache exceeds AUDIO_CACHE_MAX_BYTES"""
+    try:
+        entries = []
+        total = 0
+        with os.scandir(AUDIO_CACHE_DIR) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.startswith(_CACHE_TMP_PREFIX):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        if total <= AUDIO_CACHE_MAX_BYTES:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            os.remove(path)
+            total -= size
+            if total <= AUDIO_CACHE_MAX_BYTES:
+                break
+    except OSError:
+        pass
+
+
+def play_pcm_memory(pcm) -> Tuple[bool, str]:
+    """Play raw 16-bit mono PCM on Windows by wrapping it in a WAV header in memory"""
+    import winsound
+    import wave
+    wav = io.BytesIO()
+    with wave.open(wav, 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(int(PCM_RATE))
+        w.writeframes(pcm)
+    winsound.PlaySound(wav.getvalue(), winsound.SND_MEMORY)
+    return True, ""
+
+
+def play_file(path: str) -> Tuple[bool, str]:
+    """Play a complete audio file with the platform's player"""
+    if STREAMING_PLAYER:
+        with open(path, 'rb') as f:
+            returncode = subprocess.run(STREAMING_PLAYER, stdin=f, **_PLAYER_KWARGS).returncode
+        if returncode != 0:
+            return False, f"Audio playback failed: {STREAMING_PLAYER[0]} exited with {returncode}"
+    elif sys.platform == "darwin":
+        # macOS
+        subprocess.run(["afplay", path], check=True, **_PLAYER_KWARGS)
+    elif sys.platform == "win32" and PCM_RATE:
+        # Windows
+        with open(path, 'rb') as f:
+            return play_pcm_memory(f.read())
+    elif sys.platform == "win32":
+        import winsound
+        winsound.PlaySound(path, winsound.SND_FILENAME)
+    else:
+        return False, f"Unsupported platform: {sys.platform}"
+    return True, ""
+
+
+# Error prefix for a stream that failed after audio reached the player; not retried
+STREAM_INTERRUPTED = "Stream interrupted during playback"
+
+
+def stream_to_player(response: requests.Response, proc: subprocess.Popen,
+                     cache_path: Optional[Path] = None) -> Tuple[bool, str]:
+    """
+    Feed a streaming ElevenLabs response into a player's stdin as chunks arrive
+    If cache_path is given, the clip is teed into the audio cache once fully received
+    """
+    tmp = _open_cache_tmp(cache_path) if cache_path else None
+    complete = False
+    fed = False
+    try:
+        for chunk in response.iter_content(chunk_size=2048):
+            if chunk:
+                if tmp:
+                    tmp.write(chunk)
+                proc.stdin.write(chunk)
+                fed = True
+        complete = True
+    except BrokenPipeError:
+        pass  # Player exited early (e.g. killed by the user); nothing left to feed
+    except Exception as e:
+        # Download failed mid-stream (e.g. ChunkedEncodingError): reap the player here,
+        # it would otherwise outlive us and overlap a retry
+        proc.kill()
+        proc.wait()
+        if fed:
+            # Part of the clip was already heard; replaying it from the start is worse
+            return False, f"{STREAM_INTERRUPTED}: {e}"
+        raise
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        if tmp:
+            _commit_cache_tmp(tmp, cache_path, complete)
+
+    returncode = proc.wait()
+    if returncode != 0:
+        return False, f"Audio playback failed: {proc.args[0]} exited with {returncode}"
+    return True, ""
+
+
+def send_tts_request(text: str, voice_id: str = None, timeout: float = DEFAULT_TIMEOUT,
+                     text_bytes: Optional[bytes] = None) -> Tuple[bool, str]:
     """
     Send TTS request with proper error handling
     Supports both server mode (if configured) and direct API mode
+    text_bytes is text already UTF-8 encoded, if the caller has it
     Returns (success, error_message)
     """
     # Use provided voice_id or default
@@ -170,12 +509,12 @@ def send_tts_request(text: str, voice_id: str = None, timeout: float = DEFAULT_T
     if not ELEVENLABS_API_KEY:
         return False, "ElevenLabs API key not configured"
 
+    response = None
     try:
         if SERVER_URL:
             # Server mode - use local TTS server
-            response = requests.post(
+            response = _SESSION.post(
                 SERVER_URL,
-                headers={"Content-Type": "application/json"},
                 json={
                     "text": text,
                     "voice": voice_id
@@ -190,12 +529,23 @@ def send_tts_request(text: str, voice_id: str = None, timeout: float = DEFAULT_T
 
         else:
             # Direct API mode - call ElevenLabs directly
-            response = requests.post(
+            if STREAMING_PLAYER is None and sys.platform.startswith("linux"):
+                return False, "No audio player found (install mpg123 or sox)"
+
+            # Repeated phrases play straight from disk: no request, no synthesis cost
+            cache_path = _audio_cache_path(text_bytes if text_bytes is not None else text.encode('utf-8'),
+                                           voice_id)
+            try:
+                if cache_path.stat().st_size > 0:
+                    os.utime(cache_path)  # Mark as recently used for LRU pruning
+                    return play_file(str(cache_path))
+            except OSError:
+                pass
+
+            response = _SESSION.post(
                 f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream",
-                headers={
-                    "xi-api-key": ELEVENLABS_API_KEY,
-                    "Content-Type": "application/json"
-                },
+                params=STREAM_PARAMS,
+                headers=ELEVENLABS_HEADERS,
                 json={
                     "text": text,
                     "model_id": ELEVENLABS_MODEL,  # Use configured model
@@ -208,38 +558,49 @@ def send_tts_request(text: str, voice_id: str = None, timeout: float = DEFAULT_T
                 timeout=timeout
             )
 
-            if response.status_code == 200:
-                # Save and play audio
+            if response.status_code != 200:
+                return False, f"ElevenLabs API returned {response.status_code}"
+
+            # Preferred path: pipe MP3 chunks into a player reading stdin, so audio
+            # starts with the first frame instead of after the whole clip downloads
+            if STREAMING_PLAYER:
+                proc = subprocess.Popen(STREAMING_PLAYER, stdin=subprocess.PIPE, **_PLAYER_KWARGS)
+                return stream_to_player(response, proc, cache_path)
+
+            # Windows: buffer the PCM in memory and play it from there, with no temp
+            # file to write, read back and race to delete; cache it after it plays
+            if sys.platform == "win32" and PCM_RATE:
+                buf = bytearray()
+                for chunk in response.iter_content(chunk_size=16384):
+                    buf.extend(chunk)
+                result = play_pcm_memory(buf)
+                tmp = _open_cache_tmp(cache_path) if result[0] and buf else None
+                if tmp:
+                    tmp.write(buf)
+                    _commit_cache_tmp(tmp, cache_path, True)
+                return result
+
+            # Fallback: download the whole clip for players that cannot read stdin,
+            # then keep it in the cache once it has played
+            # Nothing consumes the bytes early here, so copy in large blocks in C
+            # instead of iterating small chunks in Python
+            response.raw.decode_content = True
+            tmp = _open_cache_tmp(cache_path)
+            if tmp is None:
                 with tempfile.NamedTemporaryFile(suffix='.mp3', delete=True) as f:
-                    for chunk in response.iter_content(chunk_size=1024):
-                        if chunk:
-                            f.write(chunk)
+                    shutil.copyfileobj(response.raw, f, 65536)
                     f.flush()
-
-                    # Platform-specific audio playback
-                    if sys.platform == "darwin":
-                        # macOS
-                        subprocess.run(["afplay", f.name], check=True, capture_output=True)
-                    elif sys.platform.startswith("linux"):
-                        # Linux/Raspberry Pi - try multiple players in order
-                        for player in ["mpg123", "mpg321", "play", "aplay"]:
-                            try:
-                                subprocess.run([player, f.name], check=True, capture_output=True)
-                                break
-                            except (subprocess.CalledProcessError, FileNotFoundError):
-                                continue
-                        else:
-                            return False, "No audio player found (install mpg123 or sox)"
-                    elif sys.platform == "win32":
-                        # Windows
-                        import winsound
-                        winsound.PlaySound(f.name, winsound.SND_FILENAME)
-                    else:
-                        return False, f"Unsupported platform: {sys.platform}"
-
-                return True, ""
-            else:
-                return False, f"ElevenLabs API returned {response.status_code}"
+                    return play_file(f.name)
+
+            complete = False
+            try:
+                shutil.copyfileobj(response.raw, tmp, 65536)
+                tmp.flush()
+                result = play_file(tmp.name)
+                complete = result[0]
+                return result
+            finally:
+                _commit_cache_tmp(tmp, cache_path, complete)
 
     except requests.exceptions.Timeout:
         return False, f"Timeout after {timeout}s"
@@ -252,6 +613,9 @@ def send_tts_request(text: str, voice_id: str = None, timeout: float = DEFAULT_T
         return False, f"Audio playback failed: {e}"
     except Exception as e:
         return False, str(e)
+    finally:
+        if response is not None:
+            response.close()  # Return the connection to the pool
 
 
 def speak_with_retry(text: str, mode: str = "conversation",
@@ -273,9 +637,9 @@ def speak_with_retry(text: str, mode: str = "conversation",
     Returns:
         True if successful, False otherwise
     """
-    global recent_messages
-
     cleaned_text = clean_text_for_speech(text)
+    # Encoded once; shared by the dedup hash and the audio cache key
+    cleaned_bytes = cleaned_text.encode('utf-8')
 
     # Get voice ID from name/mapping
     voice_id = get_voice_id(voice) if voice else VOICE_ID
@@ -283,50 +647,61 @@ def speak_with_retry(text: str, mode: str = "conversation",
     # Deduplication check (unless bypassed)
     if not bypass_dedup:
         current_time = time.time()
-        text_hash = hashlib.md5(cleaned_text.encode()).hexdigest()
-
-        recent_messages = load_dedup_cache()
-        recent_messages = {k: v for k, v in recent_messages.items()
-                          if current_time - v < MESSAGE_DEDUP_WINDOW}
+        # 64-bit BLAKE2b is plenty for a seconds-long window; hex because keys persist as JSON
+        text_hash = hashlib.blake2b(cleaned_bytes, digest_size=8).hexdigest()
 
-        if text_hash in recent_messages:
-            time_since = current_time - recent_messages[text_hash]
-            print(f"🔁 Duplicate TTS detected (sent {time_since:.1f}s ago), skipping")
-            save_dedup_cache(recent_messages)
+        last_spoken = _dedup_check(text_hash, current_time)
+        if last_spoken is not None:
+            print(f"🔁 Duplicate TTS detected (sent {current_time - last_spoken:.1f}s ago), skipping")
             return True
 
-        recent_messages[text_hash] = current_time
-        save_dedup_cache(recent_messages)
+    # Bound the whole call so a stalled attempt can't hold up later utterances
+    deadline = time.monotonic() + timeout * (retries + 2)
+    delay = RETRY_DELAY
 
     for attempt in range(retries + 1):
-        current_timeout = timeout * (1 + attempt * 0.5)
+        current_timeout = min(timeout * (1 + attempt * 0.5), deadline - time.monotonic())
 
-        success, error = send_tts_request(cleaned_text, voice_id, current_timeout)
+        success, error = send_tts_request(cleaned_text, voice_id, current_timeout, cleaned_bytes)
 
         if success:
             print(f"🔊 TTS ({mode}): {cleaned_text}")
             if not bypass_dedup:
-                recent_messages[text_hash] = time.time()
-                save_dedup_cache(recent_messages)
+                _dedup_record(text_hash, time.time())
             return True
 
-        if attempt < retries:
+        # Decorrelated jitter keeps hooks that failed together from retrying in lockstep
+        delay = random.uniform(RETRY_DELAY, min(RETRY_MAX_DELAY, delay * 3))
+        retryable = not error.startswith(STREAM_INTERRUPTED)
+        if retryable and attempt < retries and time.monotonic() + delay < deadline:
             if "Timeout" in error:
                 print(f"⏱️  TTS timeout (attempt {attempt + 1}/{retries + 1}), retrying...")
             else:
                 print(f"⚠️  TTS error (attempt {attempt + 1}/{retries + 1}): {error}, retrying...")
-            time.sleep(RETRY_DELAY)
+            time.sleep(delay)
         else:
             if "Timeout" in error:
-                print(f"⏱️  TTS timeout after {retries + 1} attempts")
+                print(f"⏱️  TTS timeout after {attempt + 1} attempts")
             elif "Connection" in error:
                 print(f"🔌 TTS server appears to be down")
             else:
                 print(f"❌ TTS failed: {error}")
+            break
 
     return False
 
 
+async def speak_async(text: str, mode: str = "conversation", **kwargs) -> bool:
+    """
+    Awaitable speak_with_retry for callers running an event loop
+
+    The request, retries and playback run in a worker thread, so the loop keeps
+    serving other tasks; the pooled session is shared with the sync path.
+    """
+    import asyncio  # Deferred: ~20 ms of import time the CLI never needs
+    return await asyncio.to_thread(speak_with_retry, text, mode, **kwargs)
+
+
 def speak_conversation(text: str, **kwargs) -> bool:
     """Send TTS that returns to idle state - for questions/confirmations"""
     return speak_with_retry(text, mode="conversation", **kwargs)
@@ -369,11 +744,8 @@ def main():
     if args.list_voices:
         print("Available voices:")
         print("-" * 40)
-        seen_ids = set()
-        for name, voice_id in sorted(VOICE_MAPPINGS.items()):
-            if voice_id not in seen_ids:
-                print(f"  {name:12} → {voice_id[:20]}...")
-                seen_ids.add(voice_id)
+        for voice_id, names in sorted(_VOICES_BY_ID.items(), key=lambda item: item[1][0]):
+            print(f"  {names[0]:12} → {voice_id[:20]}...")
         print("-" * 40)
         print("You can use any name above or provide a raw voice ID")
         return
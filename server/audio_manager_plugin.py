@@ -1,20 +1,26 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import time
 import asyncio
 import uuid
+import hashlib
+import shutil
+import tempfile
 import pygame
-from mutagen.mp3 import MP3
 from asyncio import Event
-import numpy as np
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import ctypes
 import datetime
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
+from tts_cache import TTSCache
 
 try:
+    import httpx
     from elevenlabs.client import ElevenLabs
 except ImportError:
     ElevenLabs = None  # Will raise at runtime if used without install
@@ -38,6 +44,10 @@ except Exception as e:
     ELEVENLABS_VOICE = os.environ.get("ELEVENLABS_VOICE", "L.A.U.R.A.")
     ELEVENLABS_MODEL = os.environ.get("ELEVENLABS_MODEL", "eleven_flash_v2_5")
 
+# Voice-grade MP3 keeps payloads small; the 24 kHz rate also gives the voice its warmer, robotic character.
+# Override with e.g. mp3_22050_32 for smaller downloads or mp3_44100_128 for long-form listening.
+ELEVENLABS_OUTPUT_FORMAT = os.environ.get("ELEVENLABS_OUTPUT_FORMAT", "mp3_24000_48")
+
 if not ELEVENLABS_API_KEY:
     print("❌ CRITICAL: ElevenLabs API key not found!")
     raise ValueError("ELEVENLABS_API_KEY must be set in config/secret.py or environment")
@@ -45,20 +55,70 @@ if not ELEVENLABS_API_KEY:
 # Audio cache directory
 AUDIO_CACHE_DIR = os.path.expanduser("~/claude-to-speech/audio_cache")
 os.makedirs(AUDIO_CACHE_DIR, exist_ok=True)
+_AUDIO_FILE_PREFIX = os.path.join(AUDIO_CACHE_DIR, "tts_")  # Per-playback file names, joined once
+
+# Content-addressed store of synthesized phrases, keyed by (voice, model, format, text)
+TTS_CACHE_DIR = os.path.join(AUDIO_CACHE_DIR, "by_hash")
+TTS_CACHE_MAX_BYTES = int(os.environ.get("TTS_CACHE_MAX_MB", "256")) * 1024 * 1024
+os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+# Total MP3 bytes of recent phrases also kept in memory; clips over a quarter of it stay disk-only
+TTS_HOT_CACHE_MAX_BYTES = int(os.environ.get("TTS_HOT_CACHE_MAX_MB", "16")) * 1024 * 1024
+# Identical text queued again within this many seconds is dropped before synthesis
+TTS_DEDUP_WINDOW = 2.0
+# Longer texts are synthesized sentence by sentence in parallel; shorter sentences are
+# merged with their neighbours so "Dr. Smith" or "Yes." don't become clips of their own
+TTS_MIN_SEGMENT_CHARS = 60
+_RE_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+# Sentences of one text synthesized at once; more tends to hit ElevenLabs' concurrency limit
+TTS_SEGMENT_CONCURRENCY = 2
+# Retries with exponential backoff when ElevenLabs answers 429 Too Many Requests
+TTS_RATE_LIMIT_RETRIES = 3
+# How often the playback worker checks whether pygame has finished a clip (seconds)
+PLAYBACK_POLL_INTERVAL = 0.02
 
 print(f"🎵 Audio setup: Cache={AUDIO_CACHE_DIR}, Using pygame for cross-platform playback")
 # ===================================
 
 @dataclass
 class AudioManagerState:
+    # Scalar fields are only written from the event loop with plain assignments, so they are
+    # read and written without a lock. state_lock guards currently_queued_files only.
     is_playing: bool = False
     is_speaking: bool = False
     is_listening: bool = False
     playback_start_time: Optional[float] = None
     current_audio_file: Optional[str] = None
-    expected_duration: Optional[float] = None
     currently_queued_files: set = field(default_factory=set)
 
+_http_client = None
+
+def _get_http_client():
+    """
+    One pooled keep-alive connection reused by every synthesis, so only the first
+    request pays the TCP + TLS handshake. Module-level so the AudioManager rebuilt
+    by /reload_voice and /reset_audio inherits the warm connection.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=120),
+            timeout=30.0,
+        )
+    return _http_client
+
+_tts_cache = None
+
+def _get_tts_cache() -> TTSCache:
+    """
+    Process-wide TTS cache. A rebuilt AudioManager may still have syntheses from its
+    predecessor finishing in the background; they must land in the same index rather
+    than a second instance that would overwrite index.json with a stale view.
+    """
+    global _tts_cache
+    if _tts_cache is None:
+        _tts_cache = TTSCache(TTS_CACHE_DIR, TTS_CACHE_MAX_BYTES)
+    return _tts_cache
+
 class AudioManager:
     def __init__(self, pv_access_key=None):
         self._initialized = False # Attribute to track initialization status
@@ -100,17 +160,33 @@ class AudioManager:
         self.audio_queue = asyncio.Queue()
         self.queue_processor_task = None
         self.is_processing_queue = False
+        self._awaiting_file = None  # Dequeued clip whose synthesis the processor is awaiting
         self.sample_rate = 16000
         self.frame_length = 2048
-        self.playback_thread = None
+        # One long-lived worker thread owns pygame playback instead of a new thread per utterance
+        self._playback_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playback")
+        self._playback_future = None
+        # Separate pool for blocking ElevenLabs calls so several clips can synthesize at once
+        self._tts_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tts")
         self.stop_playback_event = threading.Event()
+        self.tts_cache = _get_tts_cache()
+        self._hot_cache = OrderedDict()  # {cache_path: mp3 bytes}, most recently used last
+        self._hot_bytes = 0
+        self._cache_stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "shared": 0}
+        # Synthesis futures by cache path, so identical text requested concurrently is generated once
+        self._inflight_synthesis = {}  # {cache_path: executor future}
+        self._pending_tasks = set()  # Fire-and-forget tasks, referenced until done
+        # Dedup window: (hash, time queued) in arrival order plus a set for O(1) membership
+        self._recent_text = deque()
+        self._recent_text_hashes = set()
 
         if ElevenLabs is None:
             print("CRITICAL: ElevenLabs package is not installed. TTS functionality will fail.")
             return
 
         try:
-            self.eleven = ElevenLabs(api_key=ELEVENLABS_API_KEY)
+            self._http_client = _get_http_client()
+            self.eleven = ElevenLabs(api_key=ELEVENLABS_API_KEY, httpx_client=self._http_client)
         except Exception as e:
             print(f"CRITICAL: Failed to initialize ElevenLabs client: {e}. TTS functionality will fail.")
             return
@@ -126,6 +202,20 @@ class AudioManager:
         """Check if the audio manager has been successfully initialized."""
         return self._initialized
 
+    def warm_up(self):
+        """Open the ElevenLabs connection in the background so the first utterance skips the handshake."""
+        if not self._initialized:
+            return
+        self._warm_up_task = asyncio.get_running_loop().run_in_executor(self._tts_pool, self._warm_up_connection)
+
+    def _warm_up_connection(self):
+        try:
+            start = time.monotonic()
+            self.eleven.voices.get_all()
+            print(f"🔌 [AudioManager] ElevenLabs connection warmed up in {(time.monotonic() - start) * 1000:.0f} ms")
+        except Exception as e:
+            print(f"Warning: ElevenLabs warm-up request failed: {e}")
+
     async def hard_reset(self):
         await self.stop_current_audio()
         await self.stop_audio_queue()
@@ -133,8 +223,7 @@ class AudioManager:
         self.state = AudioManagerState()
         if hasattr(self, 'processed_response_ids'):
             self.processed_response_ids.clear()
-        if not self.is_processing_queue:
-            self.queue_processor_task = asyncio.create_task(self.process_audio_queue())
+        self._ensure_queue_processor()
 
     async def queue_audio(self, audio_file: Optional[str] = None, generated_text: Optional[str] = None, delete_after_play: bool = False):
         if not self._initialized:
@@ -142,71 +231,221 @@ class AudioManager:
             return
 
         if generated_text and not audio_file:
-            unique_file = self._generate_unique_audio_filename()
-            try:
-                await self._save_tts_to_file(generated_text, unique_file)
-                audio_file = unique_file
-            except Exception as e:
-                print(f"Error generating TTS audio: {e}")
+            if self._is_recent_duplicate(generated_text):
+                print(f"🔁 Duplicate TTS text within {TTS_DEDUP_WINDOW}s, skipping: {generated_text[:64]}...")
                 return
-
-        if audio_file:
-            async with self.state_lock:
-                if audio_file in self.state.currently_queued_files or audio_file == self.state.current_audio_file:
-                    print(f"Audio file already queued/playing, skipping: {audio_file}")
-                    return
-                self.state.currently_queued_files.add(audio_file)
-
-            await self.audio_queue.put((audio_file, None, delete_after_play))
-
-            if not self.is_processing_queue:
-                self.queue_processor_task = asyncio.create_task(self.process_audio_queue())
-            elif self.queue_processor_task and self.queue_processor_task.done():
-                print("Restarting completed queue processor task")
-                self.queue_processor_task = asyncio.create_task(self.process_audio_queue())
+            # Start synthesis for every sentence now and queue the futures in order, so
+            # sentences generate in parallel (a few at a time) and later ones (and the
+            # next clip) are ready while the current one plays
+            gate = asyncio.Semaphore(TTS_SEGMENT_CONCURRENCY)
+            previous = None
+            for segment in self._split_for_synthesis(generated_text):
+                audio_file = self._generate_unique_audio_filename()
+                synthesis = asyncio.ensure_future(self._synthesize_segment(segment, audio_file, gate, previous))
+                await self._enqueue(audio_file, synthesis, delete_after_play)
+                previous = synthesis
+        elif audio_file:
+            await self._enqueue(audio_file, None, delete_after_play)
         else:
             print("No audio file or text provided to queue_audio.")
+            return
+        # Started once per call, after everything is queued: a second consumer would
+        # let a later sentence play while an earlier one is still synthesizing
+        self._ensure_queue_processor()
+
+    def _ensure_queue_processor(self):
+        """Start the single queue consumer unless one is already running."""
+        if self.queue_processor_task is None or self.queue_processor_task.done():
+            self.is_processing_queue = True
+            self.queue_processor_task = asyncio.create_task(self.process_audio_queue())
+
+    @staticmethod
+    def _segment_failed(segment) -> bool:
+        return segment is not None and segment.done() and (segment.cancelled() or segment.exception() is not None)
+
+    async def _synthesize_segment(self, text: str, audio_file: str, gate: asyncio.Semaphore, previous):
+        """
+        Synthesize one sentence of a longer text. Completes only after the sentence
+        before it, and fails if that one failed, so a text is never played with a
+        sentence missing; sentences not yet started are skipped without an API call.
+        """
+        async with gate:
+            if self._segment_failed(previous):
+                raise RuntimeError("Skipped: an earlier sentence of this text failed")
+            await self._save_tts_with_retry(text, audio_file)
+        if previous is not None:
+            await asyncio.wait([previous])
+            if self._segment_failed(previous):
+                if os.path.exists(audio_file):
+                    os.remove(audio_file)
+                raise RuntimeError("Skipped: an earlier sentence of this text failed")
+
+    async def _save_tts_with_retry(self, text: str, file_path: str):
+        """_save_tts_to_file, backing off and retrying when ElevenLabs rate limits us (HTTP 429)."""
+        for attempt in range(TTS_RATE_LIMIT_RETRIES + 1):
+            try:
+                return await self._save_tts_to_file(text, file_path)
+            except Exception as e:
+                if getattr(e, 'status_code', None) != 429 or attempt == TTS_RATE_LIMIT_RETRIES:
+                    raise
+                delay = 0.5 * 2 ** attempt
+                print(f"⏳ [AudioManager] ElevenLabs rate limited, retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+
+    async def _enqueue(self, audio_file: str, synthesis, delete_after_play: bool):
+        async with self.state_lock:
+            if audio_file in self.state.currently_queued_files or audio_file == self.state.current_audio_file:
+                print(f"Audio file already queued/playing, skipping: {audio_file}")
+                if synthesis is not None:
+                    synthesis.cancel()
+                return
+            self.state.currently_queued_files.add(audio_file)
+
+        await self.audio_queue.put((audio_file, synthesis, delete_after_play))
+
+    @staticmethod
+    def _split_for_synthesis(text: str) -> List[str]:
+        """Split text on sentence ends, merging fragments shorter than TTS_MIN_SEGMENT_CHARS."""
+        segments = []
+        current = ""
+        for sentence in _RE_SENTENCE_END.split(text.strip()):
+            current = f"{current} {sentence}" if current else sentence
+            if len(current) >= TTS_MIN_SEGMENT_CHARS:
+                segments.append(current)
+                current = ""
+        if current:
+            if segments and len(current) < TTS_MIN_SEGMENT_CHARS:
+                segments[-1] = f"{segments[-1]} {current}"  # Don't end on a clipped fragment
+            else:
+                segments.append(current)
+        return segments
+
+    def _is_recent_duplicate(self, text: str) -> bool:
+        """Record text and report whether the same text was already queued within TTS_DEDUP_WINDOW."""
+        now = time.monotonic()
+        text_hash = hashlib.sha256(text.strip().encode()).digest()
+        while self._recent_text and now - self._recent_text[0][1] >= TTS_DEDUP_WINDOW:
+            expired_hash, _ = self._recent_text.popleft()
+            self._recent_text_hashes.discard(expired_hash)
+        if text_hash in self._recent_text_hashes:
+            return True
+        self._recent_text.append((text_hash, now))
+        self._recent_text_hashes.add(text_hash)
+        return False
 
     def _generate_unique_audio_filename(self, ext="mp3") -> str:
         ts = int(time.time() * 1000)
         unique = uuid.uuid4().hex
-        return os.path.join(AUDIO_CACHE_DIR, f"tts_{ts}_{unique}.{ext}")
+        return f"{_AUDIO_FILE_PREFIX}{ts}_{unique}.{ext}"
+
+    @staticmethod
+    def _tts_cache_voice() -> str:
+        """Voice component of the cache key; model and format change the audio just as much as the voice."""
+        return f"{ELEVENLABS_VOICE}|{ELEVENLABS_MODEL}|{ELEVENLABS_OUTPUT_FORMAT}"
+
+    @staticmethod
+    def _link_or_copy(src: str, dst: str):
+        """Expose a cached MP3 under a per-playback name without duplicating bytes when possible."""
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+
+    @staticmethod
+    def _write_clip(file_path: str, audio_bytes: bytes):
+        """Blocking: write a memory-cached clip out for playback."""
+        with open(file_path, 'wb') as f:
+            f.write(audio_bytes)
+
+    def _load_cached_clip(self, text: str, voice: str, file_path: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Blocking: on a disk cache hit, expose the clip at file_path and return
+        (cache path, bytes) for the memory cache; None on a miss.
+        """
+        cache_path = self.tts_cache.get(text, voice)
+        if cache_path is None:
+            return None
+        self._link_or_copy(cache_path, file_path)
+        with open(cache_path, 'rb') as f:
+            return cache_path, f.read()
+
+    def _remember_hot(self, cache_path: str, audio_bytes: bytes):
+        if len(audio_bytes) > TTS_HOT_CACHE_MAX_BYTES // 4:
+            return  # Long clips would push out many short hot phrases; the disk cache has them
+        old = self._hot_cache.pop(cache_path, None)
+        if old is not None:
+            self._hot_bytes -= len(old)
+        self._hot_cache[cache_path] = audio_bytes
+        self._hot_bytes += len(audio_bytes)
+        while self._hot_bytes > TTS_HOT_CACHE_MAX_BYTES:
+            _, evicted = self._hot_cache.popitem(last=False)
+            self._hot_bytes -= len(evicted)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size of the memory and disk TTS caches."""
+        return {
+            **self._cache_stats,
+            "memory_entries": len(self._hot_cache),
+            "memory_bytes": self._hot_bytes,
+            **self.tts_cache.stats(),
+        }
+
+    def clear_tts_cache(self) -> int:
+        """Drop every cached phrase from memory and disk. Returns the number of files removed."""
+        self._hot_cache.clear()
+        self._hot_bytes = 0
+        removed = self.tts_cache.clear()
+        print(f"🧹 [AudioManager] TTS cache cleared, {removed} files removed")
+        return removed
 
     async def _save_tts_to_file(self, text: str, file_path: str):
         if not self._initialized or self.eleven is None:
             print("ElevenLabs client not available. Cannot save TTS.")
             raise RuntimeError("ElevenLabs client not initialized.")
 
-        print(f"🔊 [AudioManager] Generating TTS MP3 for: {text[:64]}...")
+        voice = self._tts_cache_voice()
+        cache_path = self.tts_cache.path_for(self.tts_cache.key(text, voice))
+        hot = self._hot_cache.get(cache_path)
+        if hot is not None:
+            self._hot_cache.move_to_end(cache_path)
+            await asyncio.to_thread(self._write_clip, file_path, hot)
+            self._cache_stats["memory_hits"] += 1
+            print(f"⚡ [AudioManager] TTS memory cache hit for: {text[:64]}...")
+            return
+
+        # Lookup and file I/O off the event loop; the default executor, so a hit never
+        # queues behind synthesis
+        hit = await asyncio.to_thread(self._load_cached_clip, text, voice, file_path)
+        if hit is not None:
+            self._remember_hot(*hit)
+            self._cache_stats["disk_hits"] += 1
+            print(f"⚡ [AudioManager] TTS cache hit for: {text[:64]}...")
+            return
+
+        pending = self._inflight_synthesis.get(cache_path)
+        if pending is None:
+            self._cache_stats["misses"] += 1
+            print(f"🔊 [AudioManager] Generating TTS MP3 for: {text[:64]}...")
+        else:
+            self._cache_stats["shared"] += 1
+            print(f"⏳ [AudioManager] Waiting on in-flight TTS for: {text[:64]}...")
         
         try:
-            # Using the new ElevenLabs v2 API
-            audio_stream = self.eleven.text_to_speech.convert(
-                text=text,
-                voice_id=ELEVENLABS_VOICE,
-                model_id=ELEVENLABS_MODEL,
-                output_format="mp3_24000_48"  # Lower sample rate for warmer, robotic character
-            )
-            
-            # Collect audio chunks
-            audio_data_chunks = []
-            for chunk in audio_stream:
-                if chunk:
-                    audio_data_chunks.append(chunk)
-            
-            audio_bytes = b"".join(audio_data_chunks)
-
-            if not audio_bytes:
-                print("❌ [AudioManager] ElevenLabs generated no audio data.")
-                raise RuntimeError("ElevenLabs generated empty audio.")
-            
-            print(f"🎵 [AudioManager] ElevenLabs generated {len(audio_bytes)} bytes")
-            
-            with open(file_path, 'wb') as f:
-                f.write(audio_bytes)
-                f.flush()
-                os.fsync(f.fileno())
-                
+            if pending is None:
+                # Synthesis runs off the event loop so other requests and playback keep flowing
+                loop = asyncio.get_running_loop()
+                pending = loop.run_in_executor(self._tts_pool, self._synthesize_to_cache, text, voice)
+                self._inflight_synthesis[cache_path] = pending
+                try:
+                    # Shielded so a cancelled caller doesn't fail the others awaiting the same clip
+                    audio_bytes = await asyncio.shield(pending)
+                finally:
+                    self._inflight_synthesis.pop(cache_path, None)
+                print(f"🎵 [AudioManager] ElevenLabs generated {len(audio_bytes)} bytes")
+            else:
+                audio_bytes = await asyncio.shield(pending)
+            self._link_or_copy(cache_path, file_path)
+            self._remember_hot(cache_path, audio_bytes)
             print(f"✅ [AudioManager] Saved TTS audio to: {file_path}")
             
         except Exception as e:
@@ -218,6 +457,46 @@ class AudioManager:
                     print(f"Failed to remove partially saved file {file_path}: {rm_e}")
             raise
 
+    def _synthesize_to_cache(self, text: str, voice: str) -> bytes:
+        """
+        Blocking worker: streams ElevenLabs chunks straight into a temp file as they
+        arrive, then atomically publishes it in the TTS cache. Returns the MP3 bytes.
+        """
+        # Using the new ElevenLabs v2 API
+        audio_stream = self.eleven.text_to_speech.convert(
+            text=text,
+            voice_id=ELEVENLABS_VOICE,
+            model_id=ELEVENLABS_MODEL,
+            output_format=ELEVENLABS_OUTPUT_FORMAT
+        )
+
+        # Chunks are kept as-is and joined once at the end: one exact-size allocation
+        # instead of repeatedly growing a bytearray and then copying it into bytes
+        chunks = []
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(dir=TTS_CACHE_DIR, suffix=".tmp", delete=False) as f:
+                tmp_path = f.name
+                for chunk in audio_stream:
+                    if chunk:
+                        f.write(chunk)
+                        chunks.append(chunk)
+            # No fsync: cached audio is regenerable and closing the file is enough for local readers
+
+            if not chunks:
+                print("❌ [AudioManager] ElevenLabs generated no audio data.")
+                raise RuntimeError("ElevenLabs generated empty audio.")
+
+            self.tts_cache.put(text, voice, tmp_path)
+            tmp_path = None
+            return b"".join(chunks)
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except Exception as rm_e:
+                    print(f"Failed to remove partially saved file {tmp_path}: {rm_e}")
+
     async def process_audio_queue(self):
         if not self._initialized:
             print("AudioManager not initialized. Cannot process audio queue.")
@@ -226,20 +505,37 @@ class AudioManager:
 
         self.is_processing_queue = True
         print("Audio queue processor started.")
+        # Sleeps in audio_queue.get() until there is work; stop_audio_queue() wakes it with a
+        # (None, None, False) sentinel, so there is no periodic timeout polling
         try:
             while self.is_processing_queue:
                 try:
-                    audio_file, _, delete_after_play = await self.audio_queue.get()
-                    if audio_file:
-                        print(f"Processing from queue: {audio_file}")
-                        await self.play_audio(audio_file, delete_after_play)
-                        async with self.state_lock:
-                            self.state.currently_queued_files.discard(audio_file)
-                    self.audio_queue.task_done()
-                except asyncio.TimeoutError:
-                    if self.audio_queue.empty() and not self.is_processing_queue:
-                        break
-                    continue 
+                    audio_file, synthesis, delete_after_play = await self.audio_queue.get()
+                    try:
+                        ready = True
+                        if synthesis is not None:
+                            self._awaiting_file = audio_file
+                            try:
+                                await synthesis
+                            except Exception as e:
+                                print(f"Error generating TTS audio: {e}")
+                                ready = False
+                            finally:
+                                self._awaiting_file = None
+                            # Stopped or cleared while it was still synthesizing: drop it
+                            # rather than play a clip the user already cancelled
+                            if ready and audio_file not in self.state.currently_queued_files:
+                                print(f"Skipping clip cancelled during synthesis: {audio_file}")
+                                ready = False
+                                self._discard_queued_item(audio_file, None, delete_after_play)
+                        if audio_file and ready:
+                            print(f"Processing from queue: {audio_file}")
+                            await self.play_audio(audio_file, delete_after_play)
+                    finally:
+                        if audio_file:
+                            async with self.state_lock:
+                                self.state.currently_queued_files.discard(audio_file)
+                        self.audio_queue.task_done()
                 except Exception as e:
                     print(f"Error processing audio queue item: {e}")
                     await asyncio.sleep(0.1)
@@ -254,9 +550,9 @@ class AudioManager:
             pygame.mixer.music.load(audio_file)
             pygame.mixer.music.play()
             
-            # Wait for playback to finish
+            # Wait for playback to finish; a short tick keeps the end-of-clip lag small
             while pygame.mixer.music.get_busy() and not self.stop_playback_event.is_set():
-                time.sleep(0.1)
+                time.sleep(PLAYBACK_POLL_INTERVAL)
                 
         except Exception as e:
             print(f"Error in pygame playback worker: {e}")
@@ -270,49 +566,27 @@ class AudioManager:
             return
 
         async with self.playback_lock:
-            async with self.state_lock:
-                self.state.is_speaking = True
-                self.state.is_playing = True
-                self.state.playback_start_time = time.time()
-                self.state.current_audio_file = audio_file
+            self.state.is_speaking = True
+            self.state.is_playing = True
+            self.state.playback_start_time = time.time()
+            self.state.current_audio_file = audio_file
             
             self.audio_complete.clear()
             self.stop_playback_event.clear()
             print(f"Playing audio: {audio_file}")
 
             try:
-                # Get audio duration for timing
-                try:
-                    audio_info = MP3(audio_file)
-                    async with self.state_lock:
-                        self.state.expected_duration = audio_info.info.length
-                except Exception as e:
-                    print(f"Warning: Error calculating audio duration for {audio_file}: {e}")
-                    async with self.state_lock:
-                        self.state.expected_duration = 2.0
-
-                # Start playback in a separate thread
-                self.playback_thread = threading.Thread(
-                    target=self._pygame_playback_worker, 
-                    args=(audio_file,)
-                )
-                self.playback_thread.start()
-
-                # Wait for playback to complete
-                while self.playback_thread.is_alive():
-                    await asyncio.sleep(0.1)
-                    
-                self.playback_thread.join()
+                # Hand playback to the persistent worker thread and await its completion directly
+                self._playback_future = self._playback_executor.submit(self._pygame_playback_worker, audio_file)
+                await asyncio.wrap_future(self._playback_future)
 
             except Exception as e:
                 print(f"Error in play_audio for {audio_file}: {e}")
             finally:
-                async with self.state_lock:
-                    self.state.is_speaking = False
-                    self.state.is_playing = False
-                    self.state.playback_start_time = None
-                    self.state.current_audio_file = None
-                    self.state.expected_duration = None
+                self.state.is_speaking = False
+                self.state.is_playing = False
+                self.state.playback_start_time = None
+                self.state.current_audio_file = None
                 
                 self.audio_complete.set()
                 await self.audio_state_changed.put(('audio_completed', True))
@@ -330,6 +604,10 @@ class AudioManager:
         
         # Signal the playback thread to stop
         self.stop_playback_event.set()
+        # The queue processor may be holding the next clip while it synthesizes; un-queue it
+        # so it is dropped instead of played once synthesis finishes
+        if self._awaiting_file is not None:
+            self.state.currently_queued_files.discard(self._awaiting_file)
         
         # Stop pygame playback
         try:
@@ -337,19 +615,17 @@ class AudioManager:
         except Exception as e:
             print(f"Error stopping pygame playback: {e}")
         
-        # Wait for playback thread to finish
-        if self.playback_thread and self.playback_thread.is_alive():
-            self.playback_thread.join(timeout=2.0)
-            if self.playback_thread.is_alive():
+        # Wait for the playback worker to finish
+        if self._playback_future and not self._playback_future.done():
+            await asyncio.wait({asyncio.wrap_future(self._playback_future)}, timeout=2.0)
+            if not self._playback_future.done():
                 print("Warning: Playback thread did not stop gracefully")
 
-        async with self.state_lock:
-            if self.state.is_playing:
-                self.state.is_speaking = False
-                self.state.is_playing = False
-                self.state.playback_start_time = None
-                self.state.current_audio_file = None
-                self.state.expected_duration = None
+        if self.state.is_playing:
+            self.state.is_speaking = False
+            self.state.is_playing = False
+            self.state.playback_start_time = None
+            self.state.current_audio_file = None
         
         self.audio_complete.set()
         await self.audio_state_changed.put(('audio_stopped', True))
@@ -376,18 +652,26 @@ class AudioManager:
 
     async def clear_queue(self):
         print("Clearing audio queue...")
-        cleared_count = 0
-        while not self.audio_queue.empty():
-            try:
-                item = self.audio_queue.get_nowait()
-                self.audio_queue.task_done()
-                cleared_count += 1
-            except asyncio.QueueEmpty:
-                break
+        # No await until the drain finishes, so qsize() is exact and get_nowait() cannot run dry
+        cleared_count = self.audio_queue.qsize()
+        for _ in range(cleared_count):
+            self._discard_queued_item(*self.audio_queue.get_nowait())
+            self.audio_queue.task_done()
         async with self.state_lock:
             self.state.currently_queued_files.clear()
         print(f"Audio queue cleared. {cleared_count} items removed.")
 
+    def _discard_queued_item(self, audio_file: Optional[str], synthesis, delete_after_play: bool):
+        """Release everything held by a queue entry that will never be played."""
+        if synthesis is not None:
+            if not synthesis.cancel() and not synthesis.cancelled():
+                synthesis.exception()  # Already finished; mark any failure as retrieved
+        if delete_after_play and audio_file and os.path.exists(audio_file):
+            try:
+                os.remove(audio_file)
+            except Exception as e:
+                print(f"Error deleting audio file {audio_file}: {e}")
+
     async def wait_for_audio_completion(self, timeout: Optional[float] = None):
         if self.state.is_playing:
             print("Waiting for current audio to complete...")
@@ -415,8 +699,11 @@ class AudioManager:
 
     def reset_audio_state(self):
         print("Resetting audio state...")
-        asyncio.create_task(self.stop_current_audio())
-        asyncio.create_task(self.clear_queue())
+        for coro in (self.stop_current_audio(), self.clear_queue()):
+            # The loop only keeps weak references to tasks; hold them until they finish
+            task = asyncio.create_task(coro)
+            self._pending_tasks.add(task)
+            task.add_done_callback(self._pending_tasks.discard)
         
         self.state = AudioManagerState()
         
@@ -434,8 +721,11 @@ class AudioManager:
         except Exception as e:
             print(f"Exception during pygame cleanup in __del__: {e}")
 
-    async def shutdown(self):
-        """Gracefully shutdown the AudioManager."""
+    async def shutdown(self, close_connections: bool = True):
+        """
+        Gracefully shutdown the AudioManager. Pass close_connections=False when a
+        replacement AudioManager will reuse the shared ElevenLabs connection.
+        """
         print("AudioManager: Initiating shutdown...")
         await self.stop_current_audio()
         await self.stop_audio_queue()
@@ -446,5 +736,11 @@ class AudioManager:
             print("AudioManager: Pygame mixer terminated during shutdown.")
         except Exception as e:
             print(f"Exception during pygame shutdown: {e}")
+
+        self._playback_executor.shutdown(wait=False)
+        self._tts_pool.shutdown(wait=False)
+        self.tts_cache.flush()
+        if close_connections and getattr(self, '_http_client', None) is not None:
+            self._http_client.close()
             
         print("AudioManager: Shutdown complete.")
@@ -1,12 +1,25 @@
 import os
-import json
 from pathlib import Path
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Parsed voices.json keyed by (mtime_ns, size). importlib.reload() re-runs this module
+# in its existing namespace, so the entry survives /reload_voice and an unchanged file
+# is not parsed again.
+_VOICES_PARSE_CACHE = globals().get("_VOICES_PARSE_CACHE", {})
+
 # Load voices configuration
 VOICES_FILE = Path(__file__).parent / "voices.json"
 try:
-    with open(VOICES_FILE, 'r') as f:
-        VOICES_DATA = json.load(f)
+    _st = VOICES_FILE.stat()
+    _key = (_st.st_mtime_ns, _st.st_size)
+    if _key not in _VOICES_PARSE_CACHE:
+        _VOICES_PARSE_CACHE.clear()
+        _VOICES_PARSE_CACHE[_key] = _json_loads(VOICES_FILE.read_bytes())
+    VOICES_DATA = _VOICES_PARSE_CACHE[_key]
     ACTIVE_VOICE = VOICES_DATA.get("active_voice", "L.A.U.R.A.")
 except Exception as e:
     print(f"Error loading voices: {e}")
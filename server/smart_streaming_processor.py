@@ -1,23 +1,27 @@
-# smart_streaming_processor.py - DEBUG VERSION
+# smart_streaming_processor.py
 import asyncio
 import time
 import logging
 import re
 from typing import Optional
+from collections import OrderedDict
 from difflib import SequenceMatcher
 
-# Configure logging
+# Handlers and level are configured by tts_server.py
 logger = logging.getLogger(__name__)
-# Basic config if not configured by main server script
-if not logger.handlers:
-    logging.basicConfig(
-        level=logging.DEBUG,  # Changed to DEBUG
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler("tts_server_debug.log", mode='a'),
-            logging.StreamHandler()
-        ]
-    )
+
+# Patterns used on every chunk, compiled once
+_RE_WS = re.compile(r'\s+')
+_RE_EMPTY_PAREN = re.compile(r'\(\s*\)')
+_RE_NON_SPACE_WS = re.compile(r'[^\S ]')  # Whitespace other than a plain space, newlines included
+_RE_TRAIL_PERIOD = re.compile(r'\s*\.\s*$')
+
+# One-shots whose complete message never arrives (client disconnects) are evicted oldest-first
+MAX_STORED_ONESHOTS = 256
+_ID_SUFFIXES = r'(?:oneshot|delta|complete|full|finalized|stop)'
+_RE_ID_SUFFIX = re.compile(
+    r'([^-]*-[^-]*(?:-[^-]*)*?)(?:-' + _ID_SUFFIXES + r'){1,2}\Z'
+)
 
 class SimplifiedTTSProcessor:
     """
@@ -27,7 +31,7 @@ class SimplifiedTTSProcessor:
     def __init__(self, audio_manager):
         self.audio_manager = audio_manager
         # Store raw one-shot text per base response ID for delta calculation
-        self.oneshot_raw_texts = {}  # {base_response_id: raw_oneshot_text}
+        self.oneshot_raw_texts = OrderedDict()  # {base_response_id: raw_oneshot_text}, oldest first
         logger.info("SimplifiedTTSProcessor initialized.")
 
     def _clean_text_for_tts(self, text_from_client: str) -> str:
@@ -38,16 +42,18 @@ class SimplifiedTTSProcessor:
             return ""
         
         cleaned_text = text_from_client.strip()
+
+        # Fast path for the usual single-line sentence: nothing below would change it
+        if '(' not in cleaned_text and '  ' not in cleaned_text and not _RE_NON_SPACE_WS.search(cleaned_text):
+            return cleaned_text
         
         # Just handle basic formatting for TTS
         # Replace double newlines with periods
         cleaned_text = cleaned_text.replace('\n\n', '. ')
-        # Replace single newlines with spaces
-        cleaned_text = cleaned_text.replace('\n', ' ')
-        # Collapse multiple spaces
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
+        # Collapse whitespace runs, remaining single newlines included
+        cleaned_text = _RE_WS.sub(' ', cleaned_text)
         # Remove empty parentheses
-        cleaned_text = re.sub(r'\(\s*\)', '', cleaned_text)
+        cleaned_text = _RE_EMPTY_PAREN.sub('', cleaned_text)
         
         return cleaned_text.strip()
 
@@ -57,15 +63,10 @@ class SimplifiedTTSProcessor:
         e.g., "claude-resp-XYZ-oneshot" -> "claude-resp-XYZ"
         e.g., "claude-resp-XYZ-complete" -> "claude-resp-XYZ"
         """
-        parts = full_response_id.split('-')
-        known_suffixes = ["oneshot", "delta", "complete", "full", "finalized", "stop"]
-        
-        if len(parts) > 2 and parts[-1] in known_suffixes:
-            # Handle compound suffixes like "oneshot-finalized"
-            if len(parts) > 3 and parts[-2] in known_suffixes:
-                return '-'.join(parts[:-2])
-            return '-'.join(parts[:-1])
-        return full_response_id
+        # Handles compound suffixes like "oneshot-finalized"; the base must keep at
+        # least two segments, so IDs like "x-complete" are returned unchanged
+        match = _RE_ID_SUFFIX.match(full_response_id)
+        return match.group(1) if match else full_response_id
 
     def _normalize_for_comparison(self, text: str) -> str:
         """Normalize text for comparison by removing formatting differences"""
@@ -73,14 +74,14 @@ class SimplifiedTTSProcessor:
             return ""
         
         # Remove all newlines and extra spaces (like DOM cleaning does)
-        normalized = re.sub(r'\s+', ' ', text)
+        normalized = _RE_WS.sub(' ', text)
         
         # Strip quotes and whitespace
         normalized = normalized.strip().lstrip('"\'`')
         
         # Remove common DOM artifacts
-        normalized = re.sub(r'\s*\.\s*$', '', normalized)  # Remove trailing periods
-        normalized = re.sub(r'\s+', ' ', normalized)  # Collapse spaces again
+        normalized = _RE_TRAIL_PERIOD.sub('', normalized)  # Remove trailing periods
+        normalized = _RE_WS.sub(' ', normalized)  # Collapse spaces again
         
         return normalized.strip()
 
@@ -90,56 +91,66 @@ class SimplifiedTTSProcessor:
         Uses both exact matching and fuzzy matching for robust detection.
         """
         if not oneshot_text or not full_text:
-            logger.debug(f"[DEDUP] Empty text - oneshot empty: {not oneshot_text}, full empty: {not full_text}")
+            logger.debug("[DEDUP] Empty text - oneshot empty: %s, full empty: %s", not oneshot_text, not full_text)
             return full_text
         
         # Normalize both texts for comparison
         oneshot_normalized = self._normalize_for_comparison(oneshot_text)
         full_normalized = self._normalize_for_comparison(full_text)
         
-        logger.debug(f"[DEDUP] Oneshot normalized: '{oneshot_normalized[:100]}...'")
-        logger.debug(f"[DEDUP] Full normalized: '{full_normalized[:100]}...'")
+        logger.debug("[DEDUP] Oneshot normalized: '%s...'", oneshot_normalized[:100])
+        logger.debug("[DEDUP] Full normalized: '%s...'", full_normalized[:100])
         
         # Try exact match first (most reliable)
         if full_normalized.startswith(oneshot_normalized):
-            logger.info(f"[DEDUP] ✅ Exact match found at start, removing {len(oneshot_text)} chars")
+            logger.info("[DEDUP] ✅ Exact match found at start, removing %s chars", len(oneshot_text))
             # Find the actual position in the original text by length ratio
             ratio = len(oneshot_text) / len(oneshot_normalized) if len(oneshot_normalized) > 0 else 1
             cutoff = int(len(oneshot_normalized) * ratio)
             remaining = full_text[cutoff:].strip()
-            logger.debug(f"[DEDUP] Remaining text after exact match: '{remaining[:100]}...'")
+            logger.debug("[DEDUP] Remaining text after exact match: '%s...'", remaining[:100])
             return remaining
         
-        # Try fuzzy matching with sequence matcher
-        matcher = SequenceMatcher(None, oneshot_normalized.lower(), full_normalized.lower())
-        match = matcher.find_longest_match(0, len(oneshot_normalized), 0, len(full_normalized))
-        
-        # Require a strong match (at least 80% of oneshot length)
-        match_quality = match.size / len(oneshot_normalized) if len(oneshot_normalized) > 0 else 0
+        oneshot_key = oneshot_normalized.lower()
+        full_key = full_normalized.lower()
+
+        # Verbatim containment is the common case and needs only a linear find;
+        # the O(n*m) sequence matcher is kept as the fallback for edited text
+        idx = full_key.find(oneshot_key) if oneshot_key else -1
+        if idx != -1:
+            match_start, match_size = idx, len(oneshot_key)
+            logger.debug("[DEDUP] Substring match at %s, match size: %s", idx, match_size)
+        else:
+            matcher = SequenceMatcher(None, oneshot_key, full_key)
+            match = matcher.find_longest_match(0, len(oneshot_key), 0, len(full_key))
+            match_start, match_size = match.b, match.size
+
+        # Require a strong match (at least 70% of oneshot length)
+        match_quality = match_size / len(oneshot_normalized) if len(oneshot_normalized) > 0 else 0
         
-        logger.debug(f"[DEDUP] Fuzzy match quality: {match_quality:.2f}, match size: {match.size}")
+        logger.debug("[DEDUP] Fuzzy match quality: %.2f, match size: %s", match_quality, match_size)
         
         if match_quality >= 0.7:
-            logger.info(f"[DEDUP] ✅ Fuzzy match found: quality={match_quality:.2f}, removing overlap")
+            logger.info("[DEDUP] ✅ Fuzzy match found: quality=%.2f, removing overlap", match_quality)
             
             # Calculate position in original text based on normalized match
             char_ratio = len(full_text) / len(full_normalized) if len(full_normalized) > 0 else 1
-            start_pos = int(match.b * char_ratio)
-            end_pos = int((match.b + match.size) * char_ratio)
+            start_pos = int(match_start * char_ratio)
+            end_pos = int((match_start + match_size) * char_ratio)
             
             # Remove the matched portion
             remaining_text = (full_text[:start_pos] + full_text[end_pos:]).strip()
             
             if remaining_text:
-                logger.info(f"[DEDUP] Removed fuzzy match, {len(remaining_text)} chars remaining")
-                logger.debug(f"[DEDUP] Remaining text: '{remaining_text[:100]}...'")
+                logger.info("[DEDUP] Removed fuzzy match, %s chars remaining", len(remaining_text))
+                logger.debug("[DEDUP] Remaining text: '%s...'", remaining_text[:100])
                 return remaining_text
             else:
                 logger.info("[DEDUP] ⚠️ No remaining text after fuzzy match removal")
                 return ""
         
         # No good match found, return full text
-        logger.warning(f"[DEDUP] ❌ No reliable match found (best quality: {match_quality:.2f}), keeping full text")
+        logger.warning("[DEDUP] ❌ No reliable match found (best quality: %.2f), keeping full text", match_quality)
         return full_text
 
     async def process_chunk(self, text_content: str, full_response_id: str, is_complete: bool):
@@ -147,80 +158,91 @@ class SimplifiedTTSProcessor:
         Processes a text chunk received from the client.
         """
         if not self.audio_manager:
-            logger.error(f"Audio manager not available. Cannot process chunk for {full_response_id}.")
+            logger.error("Audio manager not available. Cannot process chunk for %s.", full_response_id)
             return
 
-        logger.info(f"[PROCESS] Received chunk for {full_response_id}: '{text_content[:75]}...', complete: {is_complete}")
+        # Checked once per chunk so the slices and key lists below are only built when logged
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("[PROCESS] Received chunk for %s: '%s...', complete: %s", full_response_id, text_content[:75], is_complete)
 
         base_id = self._get_base_response_id(full_response_id)
-        logger.debug(f"[PROCESS] Extracted base_id: {base_id} from {full_response_id}")
+        if debug:
+            logger.debug("[PROCESS] Extracted base_id: %s from %s", base_id, full_response_id)
 
         if not is_complete and "oneshot" in full_response_id:
             # This is the raw one-shot - store it and queue for TTS
             self.oneshot_raw_texts[base_id] = text_content
-            logger.info(f"[PROCESS] 📝 Storing raw one-shot for {base_id}: '{text_content[:50]}...'")
-            logger.debug(f"[PROCESS] Current stored oneshots: {list(self.oneshot_raw_texts.keys())}")
+            self.oneshot_raw_texts.move_to_end(base_id)
+            while len(self.oneshot_raw_texts) > MAX_STORED_ONESHOTS:
+                self.oneshot_raw_texts.popitem(last=False)
+            if debug:
+                logger.debug("[PROCESS] 📝 Storing raw one-shot for %s: '%s...'", base_id, text_content[:50])
+                logger.debug("[PROCESS] Current stored oneshots: %s", list(self.oneshot_raw_texts.keys()))
             
             # Clean and queue the one-shot
             cleaned_oneshot = self._clean_text_for_tts(text_content)
             if cleaned_oneshot:
-                logger.info(f"[PROCESS] 🔊 Queueing oneshot for TTS: '{cleaned_oneshot[:50]}...'")
+                logger.info("[PROCESS] 🔊 Queueing oneshot for TTS: '%s...'", cleaned_oneshot[:50])
                 await self._queue_for_tts(cleaned_oneshot, full_response_id)
             
         elif is_complete:
             # This is the DOM-cleaned full response
-            logger.info(f"[PROCESS] 📄 Processing complete response for {base_id}")
-            logger.debug(f"[PROCESS] Stored oneshots available: {list(self.oneshot_raw_texts.keys())}")
+            logger.info("[PROCESS] 📄 Processing complete response for %s", base_id)
+            if debug:
+                logger.debug("[PROCESS] Stored oneshots available: %s", list(self.oneshot_raw_texts.keys()))
             
             text_to_process = text_content
             
             # Check if we have a one-shot to deduplicate
             if base_id in self.oneshot_raw_texts:
                 stored_oneshot = self.oneshot_raw_texts[base_id]
-                logger.info(f"[PROCESS] 🔍 Found stored oneshot for deduplication")
-                logger.debug(f"[PROCESS] Stored oneshot: '{stored_oneshot[:100]}...'")
-                logger.debug(f"[PROCESS] Full text: '{text_content[:100]}...'")
+                logger.info("[PROCESS] 🔍 Found stored oneshot for deduplication")
+                if debug:
+                    logger.debug("[PROCESS] Stored oneshot: '%s...'", stored_oneshot[:100])
+                    logger.debug("[PROCESS] Full text: '%s...'", text_content[:100])
                 
                 # Use improved fuzzy matching to remove overlap
                 text_to_process = self._find_and_remove_oneshot_overlap(stored_oneshot, text_content)
                 
                 # Clean up stored one-shot
                 del self.oneshot_raw_texts[base_id]
-                logger.debug(f"[PROCESS] Deleted oneshot for {base_id}, remaining: {list(self.oneshot_raw_texts.keys())}")
+                if debug:
+                    logger.debug("[PROCESS] Deleted oneshot for %s, remaining: %s", base_id, list(self.oneshot_raw_texts.keys()))
                 
                 if not text_to_process.strip():
-                    logger.info(f"[PROCESS] ⚠️ No remaining content after deduplication for {base_id}")
+                    logger.info("[PROCESS] ⚠️ No remaining content after deduplication for %s", base_id)
                     return
             else:
                 # No one-shot stored - process the full text
-                logger.warning(f"[PROCESS] ❌ No one-shot found for {base_id}. Processing full text.")
+                logger.warning("[PROCESS] ❌ No one-shot found for %s. Processing full text.", base_id)
             
             # Clean and queue whatever we decided to process
             cleaned_text = self._clean_text_for_tts(text_to_process)
             if cleaned_text:
-                logger.info(f"[PROCESS] 🔊 Queueing complete response for TTS: '{cleaned_text[:50]}...'")
+                logger.info("[PROCESS] 🔊 Queueing complete response for TTS: '%s...'", cleaned_text[:50])
                 await self._queue_for_tts(cleaned_text, full_response_id)
             else:
-                logger.warning(f"[PROCESS] No text to queue after cleaning for {full_response_id}")
+                logger.warning("[PROCESS] No text to queue after cleaning for %s", full_response_id)
 
     async def _queue_for_tts(self, text: str, response_id: str):
         try:
-            logger.debug(f"[QUEUE] Queueing text for TTS (ID: {response_id}), length: {len(text)}")
+            logger.debug("[QUEUE] Queueing text for TTS (ID: %s), length: %s", response_id, len(text))
             await self.audio_manager.queue_audio(generated_text=text, delete_after_play=True)
-            logger.info(f"[QUEUE] ✅ Successfully queued for TTS (ID: {response_id})")
+            logger.debug("[QUEUE] ✅ Successfully queued for TTS (ID: %s)", response_id)
         except Exception as e:
-            logger.error(f"[QUEUE] ❌ Error queuing audio for {response_id}: {e}", exc_info=True)
+            logger.error("[QUEUE] ❌ Error queuing audio for %s: %s", response_id, e, exc_info=True)
 
     async def reset_conversation(self, response_id: Optional[str] = None):
         """
         Resets the state for a new conversation or on client request.
         """
         context = f" (context: {response_id})" if response_id else ""
-        logger.info(f"[RESET] 🔄 Resetting conversation state{context}")
+        logger.info("[RESET] 🔄 Resetting conversation state%s", context)
         
         # Log what we're clearing
         if self.oneshot_raw_texts:
-            logger.debug(f"[RESET] Clearing stored oneshots: {list(self.oneshot_raw_texts.keys())}")
+            logger.debug("[RESET] Clearing stored oneshots: %s", list(self.oneshot_raw_texts.keys()))
         
         # Clear stored one-shots
         self.oneshot_raw_texts.clear()
@@ -228,8 +250,8 @@ class SimplifiedTTSProcessor:
         if self.audio_manager:
             await self.audio_manager.clear_queue()
             await self.audio_manager.stop_current_audio()
-            logger.info(f"[RESET] ✅ Audio manager queue cleared and audio stopped{context}.")
+            logger.info("[RESET] ✅ Audio manager queue cleared and audio stopped%s.", context)
         else:
-            logger.warning(f"[RESET] ⚠️ Audio manager not available during reset{context}.")
+            logger.warning("[RESET] ⚠️ Audio manager not available during reset%s.", context)
         
-        logger.info(f"[RESET] ✅ Conversation reset complete{context}.")
+        logger.info("[RESET] ✅ Conversation reset complete%s.", context)
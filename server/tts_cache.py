@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+
+import os
+import re
+import json
+import time
+import hashlib
+import tempfile
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Optional, Dict, Any
+
+_RE_WS = re.compile(r'\s+')
+
+
+def _normalize(text: str) -> str:
+    """
+    Fold differences that don't change the spoken result, so streams whose
+    whitespace or Unicode forms jitter still hit: NFKC (full-width forms,
+    ligatures, non-breaking spaces) and collapsed, trimmed whitespace.
+    Case and punctuation are kept since they change how ElevenLabs reads the text.
+    """
+    return _RE_WS.sub(' ', unicodedata.normalize("NFKC", text)).strip()
+
+
+def _valid_entry(entry) -> bool:
+    """An index entry as written by TTSCache: {"path": str, "bytes": int, "last_used": number}."""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("path"), str)
+        and isinstance(entry.get("bytes"), int)
+        and isinstance(entry.get("last_used"), (int, float))
+    )
+
+
+class TTSCache:
+    """
+    Content-addressed store of synthesized clips, keyed by BLAKE2b of (voice, text).
+
+    Files live at <cache_dir>/<key>.mp3 next to an index.json of
+    {key: {"path", "bytes", "last_used"}} so stats and eviction never need a
+    directory scan. In memory the index is an OrderedDict in LRU order with a
+    running byte total, so hits and evictions are O(1). Thread-safe; get/put
+    touch the disk, so async callers should run them in a worker thread.
+    """
+
+    INDEX_FLUSH_INTERVAL = 5.0  # seconds; min gap between index writes from put()
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self._path_prefix = os.path.join(cache_dir, "")  # Joined once; path_for runs per clip
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_flush = 0.0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index = self._load_index()
+        self._total_bytes = sum(e["bytes"] for e in self._index.values())
+
+    @staticmethod
+    def key(text: str, voice: str) -> str:
+        """Cache key; text is normalized first, but synthesis still gets the original."""
+        return hashlib.blake2b(f"{voice}|{_normalize(text)}".encode(), digest_size=16).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return f"{self._path_prefix}{key}.mp3"
+
+    def get(self, text: str, voice: str) -> Optional[str]:
+        """Path of the cached clip for (text, voice), or None on a miss. Blocking (stat + lock)."""
+        key = self.key(text, voice)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            if not os.path.exists(entry["path"]):
+                # Removed behind our back; forget it
+                del self._index[key]
+                self._total_bytes -= entry["bytes"]
+                self._dirty = True
+                return None
+            entry["last_used"] = time.time()
+            self._index.move_to_end(key)
+            self._dirty = True  # Written by the next put() or flush(), never from a lookup
+            return entry["path"]
+
+    def put(self, text: str, voice: str, src_path: str) -> str:
+        """Atomically move a finished clip at src_path into the cache; returns its cache path."""
+        key = self.key(text, voice)
+        path = self.path_for(key)
+        os.replace(src_path, path)
+        size = os.path.getsize(path)
+        with self._lock:
+            old = self._index.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old["bytes"]
+            self._index[key] = {"path": path, "bytes": size, "last_used": time.time()}
+            self._total_bytes += size
+            self._dirty = True
+            self._prune_locked()
+            # Throttled: the index is rewritten at most every INDEX_FLUSH_INTERVAL
+            self._maybe_flush_locked()
+        return path
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "disk_entries": len(self._index),
+                "disk_bytes": self._total_bytes,
+                "disk_max_bytes": self.max_bytes,
+            }
+
+    def clear(self) -> int:
+        """Delete every cached clip. Returns the number of files removed."""
+        removed = 0
+        with self._lock:
+            for entry in self._index.values():
+                try:
+                    os.remove(entry["path"])
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"Failed to remove cached file {entry['path']}: {e}")
+            self._index.clear()
+            self._total_bytes = 0
+            self._dirty = True
+            self._flush_locked()
+        return removed
+
+    def flush(self):
+        """Persist the index if it changed; called on shutdown."""
+        with self._lock:
+            self._flush_locked()
+
+    def _prune_locked(self):
+        """Evict least recently used clips (front of the index) while over max_bytes."""
+        if self._total_bytes <= self.max_bytes:
+            return
+        skipped = []
+        while self._total_bytes > self.max_bytes and len(self._index) > 1:
+            key, entry = self._index.popitem(last=False)
+            try:
+                os.unlink(entry["path"])
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Warning: could not evict cached file {entry['path']}: {e}")
+                skipped.append((key, entry))
+                continue
+            self._total_bytes -= entry["bytes"]
+        for key, entry in reversed(skipped):
+            # Keep files we could not delete accounted for, still at the cold end
+            self._index[key] = entry
+            self._index.move_to_end(key, last=False)
+        print(f"🧹 [TTSCache] Pruned to {self._total_bytes / (1024 * 1024):.1f} MB")
+
+    def _maybe_flush_locked(self):
+        if time.monotonic() - self._last_flush >= self.INDEX_FLUSH_INTERVAL:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._dirty:
+            return
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile('w', dir=self.cache_dir, suffix=".tmp", delete=False) as f:
+                tmp_path = f.name
+                json.dump(self._index, f)
+            os.replace(tmp_path, self.index_path)
+            tmp_path = None
+            self._dirty = False
+            self._last_flush = time.monotonic()
+        except OSError as e:
+            print(f"Warning: could not write TTS cache index: {e}")
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _load_index(self) -> "OrderedDict[str, Dict[str, Any]]":
+        index = {}
+        try:
+            with open(self.index_path, 'r') as f:
+                loaded = json.load(f)
+            if not isinstance(loaded, dict) or not all(map(_valid_entry, loaded.values())):
+                raise ValueError("malformed index")
+            index = loaded
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Warning: TTS cache index unreadable ({e}), rebuilding from disk")
+
+        # Reconcile with the directory once at startup: the index is flushed lazily, so
+        # clips written shortly before a crash may be missing from it (adopted with their
+        # mtime as last use) and entries may point at files that are gone (dropped)
+        on_disk = {}
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(".mp3"):
+                        key = entry.name[:-len(".mp3")]
+                        known = index.get(key)
+                        if known is not None and known["path"] == entry.path:
+                            on_disk[key] = known
+                        else:
+                            st = entry.stat()
+                            on_disk[key] = {"path": entry.path, "bytes": st.st_size, "last_used": st.st_mtime}
+        except OSError as e:
+            print(f"Warning: could not scan TTS cache: {e}")
+            on_disk = index
+        self._dirty = on_disk != index
+        # Least recently used first
+        return OrderedDict(sorted(on_disk.items(), key=lambda item: item[1]["last_used"]))
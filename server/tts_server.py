@@ -3,21 +3,32 @@
 
 import asyncio
 import sys 
-import os
 import time
+import itertools
 import traceback
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
-# Configure logging for the server
-logging.basicConfig(
-    level=logging.INFO, # Can be DEBUG for more verbosity
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
+# Configure logging for the server, unless a host app already has; checked up front
+# because the FileHandler below would open tts_server.log even if basicConfig ignored it.
+# Records are formatted on the calling thread and handed to a QueueListener thread that
+# does the actual file/console writes, so logging never blocks the event loop on I/O.
+_log_listener = None
+if not logging.getLogger().handlers:
+    _log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(
+        _log_queue,
         logging.FileHandler("tts_server.log", mode='a'),
         logging.StreamHandler()
-    ]
-)
+    )
+    logging.basicConfig(
+        level=logging.INFO, # Can be DEBUG for more verbosity
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[QueueHandler(_log_queue)]
+    )
+    _log_listener.start()
 logger = logging.getLogger(__name__)
 
 # Suppress verbose logs from Quart framework
@@ -25,23 +36,54 @@ logging.getLogger('quart.app').setLevel(logging.WARNING)
 logging.getLogger('quart.serving').setLevel(logging.WARNING)
 
 from quart import Quart, request, jsonify
+from quart.json.provider import DefaultJSONProvider
 from quart_cors import cors
+from werkzeug.exceptions import HTTPException
 from audio_manager_plugin import AudioManager
 from smart_streaming_processor import SimplifiedTTSProcessor # Updated import
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Falls back to Quart's stdlib json provider
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Falls back to the default asyncio event loop
+
 CONFIG = {
     "output_dir": str(Path.home() / "Desktop" / "laura" / "audio_cache"), # Consolidated audio cache location
     "max_retries": 3,
-    "retry_delay": 0.5
+    "retry_delay": 0.5,
+    "max_text_chars": 64_000  # Longest text accepted by /stream; real chunks are far smaller
 }
 
-os.makedirs(CONFIG["output_dir"], exist_ok=True)
-
 app = Quart(__name__)
 app = cors(app, allow_origin="*") # Allow all origins for browser extension
+# Quart buffers request bodies in memory; reading a body over 1 MB (get_json) raises
+# RequestEntityTooLarge, which the handlers re-raise so the client gets a 413
+app.config["MAX_CONTENT_LENGTH"] = 1_048_576
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Routes request.get_json() and jsonify() through orjson"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 audio_manager = None
 tts_processor = None # Renamed from streaming_handler
+_status_body = (None, "")  # (playback state, /status JSON minus its closing brace)
+_rid_counter = itertools.count()
+
+def _default_response_id(prefix: str) -> str:
+    """ID for requests that don't send one; the counter keeps same-instant requests distinct"""
+    return f"{prefix}-{time.time_ns()}-{next(_rid_counter)}"
 
 @app.before_serving
 async def startup():
@@ -58,18 +100,20 @@ async def startup():
             logger.info("Audio manager initialized successfully.")
             tts_processor = SimplifiedTTSProcessor(audio_manager) # Use the new simplified processor
             logger.info("SimplifiedTTSProcessor initialized.")
+            audio_manager.warm_up()
         else:
             logger.error("Audio manager failed to initialize properly. TTS functionality will be impaired.")
             # tts_processor will remain None if audio_manager fails
             
     except Exception as e:
-        logger.error(f"Fatal error during audio manager startup: {e}", exc_info=True)
+        logger.error("Fatal error during audio manager startup: %s", e, exc_info=True)
         audio_manager = None 
         tts_processor = None
 
 @app.route('/stream', methods=['POST'])
 async def stream_text():
     global tts_processor
+    response_id = None  # Referenced by the error handlers, even if parsing the body fails
     if not tts_processor:
         logger.error("TTS Processor not available for /stream request.")
         return jsonify({"success": False, "error": "TTS Processor not initialized"}), 500
@@ -78,14 +122,18 @@ async def stream_text():
         data = await request.get_json()
         text = data.get('text', '')
         is_complete = data.get('is_complete', False)
-        response_id = data.get('response_id', f'stream-{int(time.time())}')
+        response_id = data.get('response_id') or _default_response_id('stream')
         source = data.get('source', 'claude')  # NEW: Track where this came from
 
-        # Log differently based on source
+        if len(text) > CONFIG["max_text_chars"]:
+            logger.warning("Rejecting oversized chunk for [%s]: %s chars", response_id, len(text))
+            return jsonify({"success": False, "error": f"Text exceeds {CONFIG['max_text_chars']} characters"}), 413
+
+        # Per-chunk, so DEBUG only; log differently based on source
         if source == 'gemini':
-            logger.info(f"🎭 Received ArgoVox chunk for [{response_id}]: {len(text)} chars, complete: {is_complete}")
+            logger.debug("🎭 Received ArgoVox chunk for [%s]: %s chars, complete: %s", response_id, len(text), is_complete)
         else:
-            logger.info(f"📥 Received Claude chunk for [{response_id}]: {len(text)} chars, complete: {is_complete}")
+            logger.debug("📥 Received Claude chunk for [%s]: %s chars, complete: %s", response_id, len(text), is_complete)
         
         # Process the chunk normally - your existing processor handles everything
         await tts_processor.process_chunk(
@@ -96,10 +144,10 @@ async def stream_text():
         
         # If this chunk is marked as complete, wait for audio processing
         if is_complete and audio_manager:
-            logger.info(f"Final chunk for {response_id}. Waiting for audio queue to process...")
+            logger.info("Final chunk for %s. Waiting for audio queue to process...", response_id)
             await audio_manager.wait_for_queue_empty(timeout=30.0) 
             await audio_manager.wait_for_audio_completion(timeout=5.0)
-            logger.info(f"Audio completion wait finished for {response_id}.")
+            logger.info("Audio completion wait finished for %s.", response_id)
 
         return jsonify({
             "success": True,
@@ -109,10 +157,12 @@ async def stream_text():
         })
 
     except asyncio.TimeoutError:
-        logger.warning(f"Timeout waiting for audio completion for final chunk {response_id}")
+        logger.warning("Timeout waiting for audio completion for final chunk %s", response_id)
         return jsonify({"success": True, "message": "Processing initiated, audio completion timed out", "response_id": response_id}), 202
+    except HTTPException:
+        raise  # e.g. 413 from MAX_CONTENT_LENGTH; let Quart send the proper status
     except Exception as e:
-        logger.error(f"❌ Stream error for {response_id}: {e}", exc_info=True)
+        logger.error("❌ Stream error for %s: %s", response_id, e, exc_info=True)
         return jsonify({"error": str(e), "success": False}), 500
 
 @app.route('/stop_audio', methods=['POST'])
@@ -126,7 +176,7 @@ async def stop_audio():
             logger.info("Audio stopped and queue cleared successfully via /stop_audio.")
             return jsonify({"success": True, "message": "Audio stopped and queue cleared"})
         except Exception as e:
-            logger.error(f"Error stopping audio: {e}", exc_info=True)
+            logger.error("Error stopping audio: %s", e, exc_info=True)
             return jsonify({"success": False, "error": str(e)}), 500
     else:
         logger.warning("Audio manager not available for /stop_audio")
@@ -137,9 +187,9 @@ async def reset_conversation():
     global tts_processor
     try:
         data = await request.get_json()
-        response_id_context = data.get('response_id', f'reset-{int(time.time())}')
+        response_id_context = data.get('response_id') or _default_response_id('reset')
         
-        logger.info(f"🔄 Reset conversation requested (context: {response_id_context})")
+        logger.info("🔄 Reset conversation requested (context: %s)", response_id_context)
         
         if tts_processor:
             await tts_processor.reset_conversation(response_id_context)
@@ -156,13 +206,16 @@ async def reset_conversation():
             "response_id": response_id_context,
             "message": f"Conversation reset successfully (context: {response_id_context})"
         })
+    except HTTPException:
+        raise  # e.g. 413 from MAX_CONTENT_LENGTH; let Quart send the proper status
     except Exception as e:
-        logger.error(f"❌ Reset error: {e}", exc_info=True)
+        logger.error("❌ Reset error: %s", e, exc_info=True)
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/tts', methods=['POST'])
 async def text_to_speech_manual():
     global tts_processor
+    response_id = None  # Referenced by the error handlers, even if parsing the body fails
     if not tts_processor:
         logger.error("TTS Processor not available for /tts (manual) request.")
         return jsonify({"success": False, "error": "TTS Processor not initialized"}), 500
@@ -170,13 +223,13 @@ async def text_to_speech_manual():
     try:
         data = await request.get_json()
         text = data.get('text', '')
-        response_id = data.get('response_id', f'manual-{int(time.time())}')
+        response_id = data.get('response_id') or _default_response_id('manual')
         
         if not text.strip():
-            logger.warning(f"Empty text provided for manual TTS {response_id}, skipping.")
+            logger.warning("Empty text provided for manual TTS %s, skipping.", response_id)
             return jsonify({"error": "No text provided"}), 400
 
-        logger.info(f"📤 Manual TTS [{response_id}]: {len(text)} chars")
+        logger.info("📤 Manual TTS [%s]: %s chars", response_id, len(text))
         await tts_processor.process_chunk(
             text_content=text,
             full_response_id=response_id,
@@ -184,9 +237,9 @@ async def text_to_speech_manual():
         )
         
         if audio_manager:
-            logger.info(f"Manual TTS {response_id}. Waiting for audio completion (timeout 30s).")
+            logger.info("Manual TTS %s. Waiting for audio completion (timeout 30s).", response_id)
             await audio_manager.wait_for_audio_completion(timeout=30.0)
-            logger.info(f"Audio completion wait finished for manual TTS {response_id}.")
+            logger.info("Audio completion wait finished for manual TTS %s.", response_id)
 
         return jsonify({
             "success": True, 
@@ -196,10 +249,12 @@ async def text_to_speech_manual():
         })
 
     except asyncio.TimeoutError:
-        logger.warning(f"Timeout waiting for audio completion for manual TTS {response_id}")
+        logger.warning("Timeout waiting for audio completion for manual TTS %s", response_id)
         return jsonify({"success": True, "message": "Manual TTS initiated, audio completion timed out", "response_id": response_id}), 202
+    except HTTPException:
+        raise  # e.g. 413 from MAX_CONTENT_LENGTH; let Quart send the proper status
     except Exception as e:
-        logger.error(f"❌ Manual TTS ERROR for {response_id}: {e}", exc_info=True)
+        logger.error("❌ Manual TTS ERROR for %s: %s", response_id, e, exc_info=True)
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/health', methods=['GET'])
@@ -229,6 +284,7 @@ async def playback_status():
     Check current playback status - used by reachy-mini mood plugin
     Returns whether audio is currently playing
     """
+    global _status_body
     is_playing = False
     current_file = None
 
@@ -236,11 +292,36 @@ async def playback_status():
         is_playing = getattr(audio_manager.state, 'is_playing', False)
         current_file = getattr(audio_manager.state, 'current_audio_file', None)
 
-    return jsonify({
-        "is_playing": is_playing,
-        "current_file": current_file,
-        "timestamp": time.time()
-    })
+    # Polled at a high rate, so the JSON is only rebuilt when playback state changes;
+    # the timestamp is appended per call
+    state = (is_playing, current_file)
+    if _status_body[0] != state:
+        body = app.json.dumps({"is_playing": is_playing, "current_file": current_file})
+        _status_body = (state, body[:-1])
+
+    return app.response_class(
+        f'{_status_body[1]},"timestamp":{time.time()}}}',
+        mimetype="application/json"
+    )
+
+@app.route('/cache', methods=['GET'])
+async def cache_stats():
+    """Report TTS cache hit/miss counters and memory/disk usage"""
+    if not audio_manager or not audio_manager.is_initialized():
+        return jsonify({"success": False, "error": "Audio manager not available"}), 500
+    return jsonify({"success": True, "cache": audio_manager.cache_stats()})
+
+@app.route('/cache/clear', methods=['POST'])
+async def cache_clear():
+    if not audio_manager or not audio_manager.is_initialized():
+        return jsonify({"success": False, "error": "Audio manager not available"}), 500
+    try:
+        removed = audio_manager.clear_tts_cache()
+        logger.info("🧹 TTS cache cleared via /cache/clear (%s files)", removed)
+        return jsonify({"success": True, "removed": removed})
+    except Exception as e:
+        logger.error("Error clearing TTS cache: %s", e, exc_info=True)
+        return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/')
 async def home():
@@ -254,14 +335,15 @@ async def reload_voice():
         # Reload the voice configuration
         import importlib
         from config import tts_config
-        importlib.reload(tts_config)
+        # Re-reads voices.json; off the event loop so a slow disk can't stall in-flight streams
+        await asyncio.to_thread(importlib.reload, tts_config)
 
-        logger.info(f"Voice config reloaded. Active voice: {tts_config.ACTIVE_VOICE}")
+        logger.info("Voice config reloaded. Active voice: %s", tts_config.ACTIVE_VOICE)
 
         # Shutdown current audio manager
         if audio_manager:
             if hasattr(audio_manager, 'shutdown') and asyncio.iscoroutinefunction(audio_manager.shutdown):
-                await audio_manager.shutdown()
+                await audio_manager.shutdown(close_connections=False)  # The new manager reuses them
 
         # Reinitialize with new voice settings
         audio_manager = AudioManager()
@@ -272,7 +354,8 @@ async def reload_voice():
 
         if audio_manager.is_initialized():
             tts_processor = SimplifiedTTSProcessor(audio_manager)
-            logger.info(f"Audio system reinitialized with voice: {tts_config.ACTIVE_VOICE}")
+            logger.info("Audio system reinitialized with voice: %s", tts_config.ACTIVE_VOICE)
+            audio_manager.warm_up()
             return jsonify({
                 "success": True,
                 "message": "Voice configuration reloaded successfully.",
@@ -284,7 +367,7 @@ async def reload_voice():
             return jsonify({"success": False, "error": "Audio system reinitialization failed."}), 500
 
     except Exception as e:
-        logger.error(f"Error during voice reload: {e}", exc_info=True)
+        logger.error("Error during voice reload: %s", e, exc_info=True)
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/reset_audio', methods=['POST']) # For full audio system re-init
@@ -294,7 +377,7 @@ async def reset_audio_system():
     try:
         if audio_manager:
             if hasattr(audio_manager, 'shutdown') and asyncio.iscoroutinefunction(audio_manager.shutdown):
-                await audio_manager.shutdown()
+                await audio_manager.shutdown(close_connections=False)  # The new manager reuses them
             # No explicit else for non-async shutdown, assuming __del__ or manual stop handles it
         
         # Reinitialize audio_manager and tts_processor
@@ -308,6 +391,7 @@ async def reset_audio_system():
         if audio_manager.is_initialized():
             tts_processor = SimplifiedTTSProcessor(audio_manager)
             logger.info("Audio system and SimplifiedTTSProcessor reinitialized successfully.")
+            audio_manager.warm_up()
             return jsonify({"success": True, "message": "Audio system reinitialized successfully."})
         else:
             logger.error("Audio system reinitialization failed.")
@@ -315,7 +399,7 @@ async def reset_audio_system():
             return jsonify({"success": False, "error": "Audio system reinitialization failed."}), 500
             
     except Exception as e:
-        logger.error(f"Error during audio system reset: {e}", exc_info=True)
+        logger.error("Error during audio system reset: %s", e, exc_info=True)
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.after_serving
@@ -327,9 +411,22 @@ async def shutdown_server(): # Renamed to avoid conflict with audio_manager.shut
             logger.info("Shutting down audio manager...")
             await audio_manager.shutdown()
     logger.info("Server shutdown complete.")
+    if _log_listener is not None:
+        _log_listener.stop()  # Flushes queued records before returning
 
 if __name__ == '__main__':
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config as HypercornConfig
+
     logger.info("Starting Claude-to-Speech TTS Server (Simplified Processor) on http://0.0.0.0:5001")
-    # debug=True enables reloader, which can be problematic for resources like pygame audio.
-    # use_reloader=False is generally safer for applications with external resource management.
-    app.run(host='0.0.0.0', port=5001, debug=False, use_reloader=False)
+    # Serve through Hypercorn directly rather than Quart's app.run() development runner.
+    # A single process is deliberate: the AudioManager owns the local pygame mixer, so
+    # extra workers would fight over the sound device. Concurrency comes from asyncio.
+    hypercorn_config = HypercornConfig()
+    hypercorn_config.bind = ["0.0.0.0:5001"]
+    hypercorn_config.keep_alive_timeout = 75  # Keep client connections warm between hook calls
+    if uvloop is not None and sys.platform != 'win32':
+        # libuv-backed loop: cheaper socket I/O and task scheduling for /stream
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    asyncio.run(serve(app, hypercorn_config))